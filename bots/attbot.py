@@ -2,16 +2,20 @@
 This is a unique discord bot that using the closed source event and server management bots using the Discord API, essentially forming a
     closed ecosystem extraction. It scans the activity of other bots in the server by creating a websocket with the hosts, using Discord's Gateway API.
 """
+import asyncio
+import dataclasses
+import functools
+import itertools
 import logging
 import os
 import re
 import sys
-from collections import defaultdict
+from collections import ChainMap, Counter, OrderedDict, defaultdict, deque
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, TypedDict, Callable
-from typing import List, Tuple, Dict, Optional
+from typing import Any, Callable
+from typing import List, Set, Tuple, Dict, Optional, Iterable, Iterator, AsyncIterator, KeysView, ValuesView
 
 import discord
 import yaml
@@ -20,6 +24,32 @@ from discord.ext import commands
 from dotenv import load_dotenv
 from pythonjsonlogger.json import JsonFormatter
 
+# Prefer the libyaml backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as _YAML_LOADER
+
+# Precompiled patterns used on the hot scanning paths
+_SNOWFLAKE_RE = re.compile(r"\d{17,20}")
+_APOLLO_RE = re.compile(r"apollo", re.IGNORECASE)
+# A non-empty name on a roster line, without the surrounding whitespace and a single leading "-" bullet, so dashes that are part of the
+# name are kept, the description variant only matches "- " lines
+_ROSTER_LINE_RE = re.compile(r"^[^\S\n]*(?:-[^\S\n]*|(?=[^-]))(\S(?:.*\S)?)[^\S\n]*$", re.MULTILINE)
+_DESCRIPTION_ROSTER_LINE_RE = re.compile(r"^[^\S\n]*-[^\S\n]*(\S(?:.*\S)?)[^\S\n]*$", re.MULTILINE)
+
+# Embed field names which, on their own, mark a field as the declined list
+_DECLINED_FIELD_NAMES = frozenset({"x", ":x:", "❌"})
+
+# From this many embeds on, /scan_apollo parses them in a worker thread, below it the thread hand-off costs more than it saves
+_THREADED_PARSE_MIN_EMBEDS = 20
+
+# Size limit for the chunks of a bot message, safely under Discord's 2000 character limit
+_CHUNK_LIMIT = 1900
+
+# Parsed config files: path -> (mtime_ns, config), so unchanged files are not parsed again
+_CFG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
 
 def setup_logger(name='attbot', log_level=logging.INFO):
     """
@@ -45,8 +75,8 @@ def setup_logger(name='attbot', log_level=logging.INFO):
     class CustomJsonFormatter(JsonFormatter):
         def add_fields(self, log_record, record, message_dict):
             super(CustomJsonFormatter, self).add_fields(log_record, record, message_dict)
-            # Add timestamp in ISO format
-            log_record['timestamp'] = datetime.now().isoformat()
+            # Add timestamp in ISO format, reusing the creation time the logging module already took for the record
+            log_record['timestamp'] = datetime.fromtimestamp(record.created).isoformat()
             log_record['level'] = record.levelname
             log_record['logger'] = record.name
 
@@ -63,10 +93,18 @@ def setup_logger(name='attbot', log_level=logging.INFO):
 LOG = setup_logger('attbot')
 
 class BotConfig:
+    __slots__ = (
+        "TOKEN", "CHANNEL_ID", "GUILD_ID", "APOLLO_AUTHOR_NAMES",
+        "DB_HOST", "DB_PORT", "DB_USER", "DB_PASSWORD", "DB_DATABASE",
+        "TEMPLATE_PATH", "_template_cache", "_target_channel",
+    )
+
     def __init__(self):
         self.TOKEN = None
         self.CHANNEL_ID = None
         self.GUILD_ID = None
+        # Exact author names of the Apollo bot, None to match any author name containing "apollo"
+        self.APOLLO_AUTHOR_NAMES: Optional[frozenset] = None
         # Database configuration
         self.DB_HOST = None
         self.DB_PORT = None
@@ -75,12 +113,32 @@ class BotConfig:
         self.DB_DATABASE = None
         # AttBot configuration
         self.TEMPLATE_PATH = None
+        # (mtime_ns, text) of the last template read
+        self._template_cache: Optional[Tuple[int, str]] = None
+        # The channel scanned by /scan_apollo, resolved once the bot is connected
+        self._target_channel: Optional[discord.abc.GuildChannel] = None
+
+    # Environment variable name -> path of the same value in the config file
+    CONFIG_KEYS = {
+        "TOKEN": ("bot", "token"),
+        "CHANNEL_ID": ("bot", "channel_id"),
+        "GUILD_ID": ("bot", "guild_id"),
+        "APOLLO_AUTHOR_NAMES": ("bot", "apollo_author_names"),
+        "DB_HOST": ("database", "host"),
+        "DB_PORT": ("database", "port"),
+        "DB_USER": ("database", "user"),
+        "DB_PASSWORD": ("database", "password"),
+        "DB_DATABASE": ("database", "database"),
+        "TEMPLATE_PATH": ("attbot", "template"),
+    }
 
     @staticmethod
     def load_config(config_path: str) -> Optional[Dict[str, Any]]:
         """
         Load configuration from a YAML file.
 
+        The parsed configuration is cached and reused until the file's modification time changes.
+
         Args:
             config_path: Path to the YAML configuration file
 
@@ -108,13 +166,20 @@ class BotConfig:
             sys.exit(1)
 
         try:
+            cache_key = str(path.resolve())
+            mtime_ns = path.stat().st_mtime_ns
+            cached = _CFG_CACHE.get(cache_key)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+
             with path.open('r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=_YAML_LOADER)
 
             if not isinstance(config, dict):
                 LOG.error("Invalid YAML structure: root element must be a mapping")
                 sys.exit(1)
 
+            _CFG_CACHE[cache_key] = (mtime_ns, config)
             return config
 
         except yaml.YAMLError as e:
@@ -125,38 +190,60 @@ class BotConfig:
             sys.exit(1)
 
     @staticmethod
-    def get_env_or_config(env_key: str, config: dict, config_path: str, transform: Optional[Callable] = None) -> Any:
+    def flatten_config(config: dict) -> Dict[str, Any]:
         """
-        Get value from an environment variable or fallback to a nested config a file.
+        Flatten the nested config into a mapping keyed by environment variable name.
 
         Args:
-            env_key: Environment variable name
             config: Configuration dictionary
-            config_path: Dot-separated path in config dictionary (e.g. 'bot.token')
-            transform: Optional function to transform the value
+
+        Returns:
+            Dictionary mapping every key in CONFIG_KEYS to its config value, or None if it isn't set
+        """
+        return {
+            env_key: functools.reduce(
+                lambda current, key: current.get(key) if isinstance(current, dict) else None,
+                config_path,
+                config
+            )
+            for env_key, config_path in BotConfig.CONFIG_KEYS.items()
+        }
+
+    @staticmethod
+    def coerce(env_key: str, value: Any, transform: Optional[Callable] = None) -> Any:
         """
-        value = os.getenv(env_key)
-
-        if value is None:
-            # Navigate nested dictionary using the path
-            current = config
-            for key in config_path.split('.'):
-                if not isinstance(current, dict):
-                    return None
-                current = current.get(key)
-                if current is None:
-                    return None
-            value = current
+        Transform a resolved config value, logging and returning None if it can't be transformed.
 
+        Args:
+            env_key: Environment variable name the value was resolved for
+            value: The resolved value
+            transform: Optional function to transform the value
+        """
         if value is not None and transform is not None:
             try:
                 value = transform(value)
             except (ValueError, TypeError) as e:
-                LOG.error(f"Error transforming value for {env_key}: {e}", extra={"config_path": config_path})
+                LOG.error(f"Error transforming value for {env_key}: {e}",
+                          extra={"config_path": ".".join(BotConfig.CONFIG_KEYS[env_key])})
                 return None
 
         return value
 
+    @staticmethod
+    def parse_names(value: Any) -> frozenset:
+        """
+        Parse a list of names, given as a YAML list or as a comma separated string like in environment variables.
+
+        Args:
+            value: The names to parse
+
+        Returns:
+            Set of the non-empty names
+        """
+        if isinstance(value, str):
+            value = value.split(",")
+        return frozenset(name for name in (str(name).strip() for name in value) if name)
+
     @staticmethod
     def is_valid_snowflake(s):
         """
@@ -172,7 +259,7 @@ class BotConfig:
             otherwise False.
         """
 
-        return bool(re.fullmatch(r"\d{17,20}", s))
+        return _SNOWFLAKE_RE.fullmatch(s) is not None
 
     def initialize(self):
         """Initialize and validate bot configuration."""
@@ -182,21 +269,24 @@ class BotConfig:
         if config is None:
             config = {}  # Provide fallback empty dict
 
+        # Environment variables take precedence over the config file
+        merged = ChainMap(os.environ, self.flatten_config(config))
 
         # Get bot values with fallback
-        self.TOKEN = self.get_env_or_config("TOKEN", config, "bot.token", str)
-        self.CHANNEL_ID = self.get_env_or_config("CHANNEL_ID", config, "bot.channel_id", int)
-        self.GUILD_ID = self.get_env_or_config("GUILD_ID", config, "bot.guild_id", str)
+        self.TOKEN = self.coerce("TOKEN", merged.get("TOKEN"), str)
+        self.CHANNEL_ID = self.coerce("CHANNEL_ID", merged.get("CHANNEL_ID"), int)
+        self.GUILD_ID = self.coerce("GUILD_ID", merged.get("GUILD_ID"), str)
+        self.APOLLO_AUTHOR_NAMES = self.coerce("APOLLO_AUTHOR_NAMES", merged.get("APOLLO_AUTHOR_NAMES"), self.parse_names) or None
 
         # Get database values with fallback
-        self.DB_HOST = self.get_env_or_config("DB_HOST", config, "database.host", str)
-        self.DB_PORT = self.get_env_or_config("DB_PORT", config, "database.port", int)
-        self.DB_USER = self.get_env_or_config("DB_USER", config, "database.user", str)
-        self.DB_PASSWORD = self.get_env_or_config("DB_PASSWORD", config, "database.password", str)
-        self.DB_DATABASE = self.get_env_or_config("DB_DATABASE", config, "database.database", str)
+        self.DB_HOST = self.coerce("DB_HOST", merged.get("DB_HOST"), str)
+        self.DB_PORT = self.coerce("DB_PORT", merged.get("DB_PORT"), int)
+        self.DB_USER = self.coerce("DB_USER", merged.get("DB_USER"), str)
+        self.DB_PASSWORD = self.coerce("DB_PASSWORD", merged.get("DB_PASSWORD"), str)
+        self.DB_DATABASE = self.coerce("DB_DATABASE", merged.get("DB_DATABASE"), str)
 
         # Get attbot values with fallback
-        self.TEMPLATE_PATH = self.get_env_or_config("TEMPLATE_PATH", config, "attbot.template", str)
+        self.TEMPLATE_PATH = self.coerce("TEMPLATE_PATH", merged.get("TEMPLATE_PATH"), str)
 
         if not self.TOKEN:
             LOG.error("Missing TOKEN value in config file.", extra={"bot.token": self.TOKEN})
@@ -210,8 +300,31 @@ class BotConfig:
             LOG.error("Missing or invalid GUILD_ID value in config file.", extra={"bot.guild_id": self.GUILD_ID})
             sys.exit(1)
 
+        # Warm the template cache, /staff_meeting_notes reports the error if it still can't be read later on
+        try:
+            self.get_template()
+        except (OSError, TypeError, UnicodeDecodeError) as e:
+            LOG.warning(f"Unable to read template file: {e}", extra={"attbot.template": self.TEMPLATE_PATH})
+
+    def get_template(self) -> str:
+        """
+        Get the staff meeting note template, only reading the file again when its modification time changed.
 
-@dataclass
+        Returns:
+            The template text
+
+        Raises:
+            OSError: If the template file can't be accessed
+            UnicodeDecodeError: If the template file isn't valid UTF-8
+        """
+        mtime_ns = os.stat(self.TEMPLATE_PATH).st_mtime_ns
+        if self._template_cache is None or self._template_cache[0] != mtime_ns:
+            text = Path(self.TEMPLATE_PATH).read_text(encoding="utf-8")
+            self._template_cache = (mtime_ns, text)
+        return self._template_cache[1]
+
+
+@dataclass(slots=True)
 class AttendanceEntry:
     """
     Class representing an attendance log entry.
@@ -222,24 +335,35 @@ class AttendanceEntry:
         event_id (int): The ID of the event
         response (str): The response type ("accepted" or "declined")
         timestamp (str): ISO format timestamp of when entry was created
+        normalized_username (str): The username run through normalize_name, computed once on creation
     """
     user_id: str
     username: str
     event_id: int
     response: str = "accepted"
     timestamp: str = None
+    normalized_username: str = dataclasses.field(init=False, repr=False, compare=False)
+    _pseudo_id: str = dataclasses.field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Set a timestamp if not provided during initialization"""
+        """Set a timestamp if not provided during initialization and compute the derived values once"""
         if self.timestamp is None:
             self.timestamp = datetime.now().isoformat()
+        self.normalized_username = normalize_name(self.username)
+        if self.response == "accepted":
+            self._pseudo_id = f"{self.event_id}-{self.user_id}"
+        else:
+            self._pseudo_id = f"{self.event_id}-{self.user_id}-declined"
 
     @property
     def pseudo_id(self) -> str:
-        """Generate the pseudo_id used for tracking unique entries"""
-        if self.response == "accepted":
-            return f"{self.event_id}-{self.user_id}"
-        return f"{self.event_id}-{self.user_id}-declined"
+        """The pseudo_id used for tracking unique entries"""
+        return self._pseudo_id
+
+    @property
+    def key(self) -> Tuple[int, str, str]:
+        """The (event_id, user_id, response) key used for the duplicate checks"""
+        return self.event_id, self.user_id, self.response
 
     def to_dict(self) -> dict:
         """Convert entry to dictionary format for storage"""
@@ -268,32 +392,76 @@ class AttendanceLog:
     """
     Class managing a collection of attendance entries.
     Provides methods for adding, querying, and analyzing attendance data.
-    """
 
-    def __init__(self):
-        self._entries: TypedDict[str, AttendanceEntry] = {}
+    The log holds at most max_entries entries (None for no limit), evicting the least recently seen entry once full.
+    """
 
-    def already_logged(self, pseudo_id: str) -> bool:
-        """Check if an entry with the given pseudo_id exists"""
-        return pseudo_id in self._entries
+    def __init__(self, max_entries: Optional[int] = 10_000):
+        self._entries: OrderedDict[str, AttendanceEntry] = OrderedDict()
+        self.max_entries = max_entries
+        # Secondary indexes, kept in sync by add_entry(), _evict_oldest() and clear()
+        self._by_user: Dict[str, List[AttendanceEntry]] = defaultdict(list)
+        self._by_event: Dict[int, List[AttendanceEntry]] = defaultdict(list)
+        # Number of entries per username, so unique_users doesn't have to walk every entry
+        self._username_counts: Counter[str] = Counter()
+        # Spellings of every normalized username with their number of entries, so inconsistent usernames are grouped while logging
+        self._username_variants: Dict[str, Counter[str]] = defaultdict(Counter)
+        # (event_id, user_id, response) keys of the stored entries, used for the duplicate checks of the scan loops, tuples hash without
+        # building a pseudo_id string first
+        self._logged_ids: Set[Tuple[int, str, str]] = set()
+
+    def already_logged(self, key: Tuple[int, str, str]) -> bool:
+        """Check if an entry with the given (event_id, user_id, response) key exists"""
+        return key in self._logged_ids
 
     def add_entry(self, entry: AttendanceEntry) -> bool:
         """
         Add a new attendance entry if it doesn't exist.
         Returns True if an entry was added, False if it already existed.
         """
-        if not self.already_logged(entry.pseudo_id):
-            self._entries[entry.pseudo_id] = entry
-            return True
-        return False
-
-    def log_attendance(self, user_id: str, username: str, event_id: int, response: str = "accepted") -> bool:
-        """Create and add a new attendance entry"""
+        pseudo_id = entry.pseudo_id
+        # A single probe that inserts the entry only if the pseudo_id is new
+        if self._entries.setdefault(pseudo_id, entry) is not entry:
+            # Seen again, so it's the last one to be evicted
+            self._entries.move_to_end(pseudo_id)
+            return False
+        self._by_user[entry.user_id].append(entry)
+        self._by_event[entry.event_id].append(entry)
+        self._username_counts[entry.username] += 1
+        self._username_variants[entry.normalized_username][entry.username] += 1
+        self._logged_ids.add(entry.key)
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            self._evict_oldest()
+        return True
+
+    def _evict_oldest(self) -> None:
+        """Remove the least recently seen entry from the log and its indexes"""
+        _, evicted = self._entries.popitem(last=False)
+        self._logged_ids.discard(evicted.key)
+        for index, key in ((self._by_user, evicted.user_id), (self._by_event, evicted.event_id)):
+            entries = index[key]
+            entries.remove(evicted)
+            if not entries:
+                del index[key]
+        self._username_counts[evicted.username] -= 1
+        if not self._username_counts[evicted.username]:
+            del self._username_counts[evicted.username]
+        variants = self._username_variants[evicted.normalized_username]
+        variants[evicted.username] -= 1
+        if not variants[evicted.username]:
+            del variants[evicted.username]
+            if not variants:
+                del self._username_variants[evicted.normalized_username]
+
+    def log_attendance(self, user_id: str, username: str, event_id: int, response: str = "accepted",
+                       timestamp: Optional[str] = None) -> bool:
+        """Create and add a new attendance entry, the timestamp defaults to now"""
         entry = AttendanceEntry(
             user_id=user_id,
             username=username.strip(),
             event_id=event_id,
-            response=response
+            response=response,
+            timestamp=timestamp
         )
         return self.add_entry(entry)
 
@@ -303,25 +471,33 @@ class AttendanceLog:
 
     def get_user_entries(self, user_id: str) -> List[AttendanceEntry]:
         """Get all entries for a specific user"""
-        return [entry for entry in self._entries.values() if entry.user_id == user_id]
+        return list(self._by_user.get(user_id, ()))
 
     def get_event_entries(self, event_id: int) -> List[AttendanceEntry]:
         """Get all entries for a specific event"""
-        return [entry for entry in self._entries.values() if entry.event_id == event_id]
+        return list(self._by_event.get(event_id, ()))
 
     def get_attendance_summary(self) -> Dict[str, Dict[str, int]]:
         """Get a summary of accepted/declined counts per user"""
-        summary = defaultdict(lambda: {"accepted": 0, "declined": 0})
+        summary: Dict[str, Dict[str, int]] = {}
         for entry in self._entries.values():
-            summary[entry.username][entry.response] += 1
-        return dict(summary)
+            counts = summary.get(entry.username)
+            if counts is None:
+                counts = summary[entry.username] = {"accepted": 0, "declined": 0}
+            counts[entry.response] += 1
+        return summary
 
     def clear(self):
         """Clear all entries"""
         self._entries.clear()
-
-    def get_all_entries(self) -> Dict[str, AttendanceEntry]:
-        """Get all entries"""
+        self._by_user.clear()
+        self._by_event.clear()
+        self._username_counts.clear()
+        self._username_variants.clear()
+        self._logged_ids.clear()
+
+    def get_all_entries(self) -> ValuesView[AttendanceEntry]:
+        """Get a live view of all entries"""
         return self._entries.values()
 
     @property
@@ -330,9 +506,13 @@ class AttendanceLog:
         return len(self._entries)
 
     @property
-    def unique_users(self) -> set:
-        """Get a set of unique usernames"""
-        return {entry.username for entry in self._entries.values()}
+    def unique_users(self) -> KeysView[str]:
+        """Get a live, set-like view of unique usernames"""
+        return self._username_counts.keys()
+
+    def get_username_variants(self) -> Dict[str, List[str]]:
+        """Get the spellings of every normalized username that was logged under more than one of them"""
+        return {name: list(variants) for name, variants in self._username_variants.items() if len(variants) > 1}
 
     def to_dict(self) -> Dict[str, dict]:
         """Convert all entries to a dictionary format"""
@@ -342,26 +522,25 @@ class AttendanceLog:
     def from_dict(cls, data: Dict[str, dict]) -> 'AttendanceLog':
         """Create an AttendanceLog instance from a dictionary"""
         log = cls()
-        for pseudo_id, entry_data in data.items():
-            entry = AttendanceEntry.from_dict(entry_data)
-            log._entries[pseudo_id] = entry
+        for entry_data in data.values():
+            log.add_entry(AttendanceEntry.from_dict(entry_data))
         return log
 
 
-@dataclass
+@dataclass(slots=True)
 class EventEntry:
     """
     Class representing a single event entry.
 
     Attributes:
         event_id: Unique identifier for the event
-        accepted: List of tuples containing (normalized_name, display_name) for accepted users
-        declined: List of tuples containing (normalized_name, display_name) for declined users
+        accepted: Mapping of normalized_name -> display_name for accepted users
+        declined: Mapping of normalized_name -> display_name for declined users
         timestamp: When the event was logged
     """
     event_id: int
-    accepted: List[Tuple[str, str]]
-    declined: List[Tuple[str, str]]
+    accepted: Dict[str, str]
+    declined: Dict[str, str]
     timestamp: str = None
 
     def __post_init__(self):
@@ -387,26 +566,79 @@ class EventLog:
     """
     Class managing a collection of event entries.
     Maintains the most recent events and provides analysis methods.
+
+    The participation counts of the stored events are kept up to date as events are added and evicted, so the summaries don't have to
+    walk every event.
     """
 
     def __init__(self, max_events: int = 8):
-        self._events: List[EventEntry] = []
+        # A bounded deque drops the oldest event on append once max_events is reached
+        self._events: deque[EventEntry] = deque(maxlen=max_events)
+        # Index of the stored events by ID, kept in sync with the deque's evictions
+        self._by_id: Dict[int, EventEntry] = {}
         self.max_events = max_events
+        # Participation counts per normalized name over the stored events, with the most recently scanned display name
+        self._accepted: Counter[str] = Counter()
+        self._declined: Counter[str] = Counter()
+        self._display_names: Dict[str, str] = {}
+
+    def _count(self, event: EventEntry) -> None:
+        """Add the participants of an event to the participation counts"""
+        for counts, participants in ((self._accepted, event.accepted), (self._declined, event.declined)):
+            for norm_name, display_name in participants.items():
+                counts[norm_name] += 1
+                self._display_names[norm_name] = display_name
+
+    def _uncount(self, event: EventEntry) -> None:
+        """Remove the participants of an evicted event from the participation counts"""
+        for counts, participants in ((self._accepted, event.accepted), (self._declined, event.declined)):
+            for norm_name in participants:
+                counts[norm_name] -= 1
+                if not counts[norm_name]:
+                    del counts[norm_name]
+                    if norm_name not in self._accepted and norm_name not in self._declined:
+                        del self._display_names[norm_name]
 
     def add_event(self, event: EventEntry) -> None:
         """Add a new event, maintaining the maximum size limit"""
+        if len(self._events) == self._events.maxlen:
+            evicted = self._events[0]
+            self._uncount(evicted)
+            # Only drop the index entry if a newer event with the same ID hasn't replaced it
+            if self._by_id.get(evicted.event_id) is evicted:
+                del self._by_id[evicted.event_id]
         self._events.append(event)
-        if len(self._events) > self.max_events:
-            self._events.pop(0)
+        self._by_id[event.event_id] = event
+        self._count(event)
+
+    def add_events(self, events: Iterable[EventEntry]) -> None:
+        """Add several events at once, maintaining the maximum size limit and rebuilding the ID index a single time"""
+        # Only the newest max_events events can end up in the deque, the same number of stored events is pushed out by them
+        events = list(events)[-self._events.maxlen:]
+        overflow = len(self._events) + len(events) - self._events.maxlen
+        for evicted in itertools.islice(self._events, max(overflow, 0)):
+            self._uncount(evicted)
+        for event in events:
+            self._count(event)
+        self._events.extend(events)
+        self._by_id = {event.event_id: event for event in self._events}
 
     def clear(self) -> None:
         """Clear all events"""
         self._events.clear()
+        self._by_id.clear()
+        self._accepted.clear()
+        self._declined.clear()
+        self._display_names.clear()
 
     @property
     def recent_events(self) -> List[EventEntry]:
         """Get a list of recent events"""
-        return self._events.copy()
+        return list(self._events)
+
+    def iter_recent(self) -> Iterator[EventEntry]:
+        """Iterate over the recent events without copying them"""
+        return iter(self._events)
 
     @property
     def total_events(self) -> int:
@@ -415,35 +647,22 @@ class EventLog:
 
     def get_event(self, event_id: int) -> Optional[EventEntry]:
         """Get event by ID"""
-        for event in self._events:
-            if event.event_id == event_id:
-                return event
-        return None
+        return self._by_id.get(event_id)
 
     def get_user_participation(self, normalized_name: str) -> Dict[str, int]:
         """Get participation summary for a user"""
-        summary = {"accepted": 0, "declined": 0}
-        for event in self._events:
-            if any(norm == normalized_name for norm, _ in event.accepted):
-                summary["accepted"] += 1
-            if any(norm == normalized_name for norm, _ in event.declined):
-                summary["declined"] += 1
-        return summary
+        return {"accepted": self._accepted[normalized_name], "declined": self._declined[normalized_name]}
 
     def get_all_participants(self) -> Dict[str, Dict[str, int]]:
         """Get a participation summary for all users"""
-        summary = {}
-        for event in self._events:
-            for norm_name, display_name in event.accepted:
-                if norm_name not in summary:
-                    summary[norm_name] = {"display_name": display_name, "accepted": 0, "declined": 0}
-                summary[norm_name]["accepted"] += 1
-
-            for norm_name, display_name in event.declined:
-                if norm_name not in summary:
-                    summary[norm_name] = {"display_name": display_name, "accepted": 0, "declined": 0}
-                summary[norm_name]["declined"] += 1
-        return summary
+        return {
+            norm_name: {
+                "display_name": display_name,
+                "accepted": self._accepted[norm_name],
+                "declined": self._declined[norm_name]
+            }
+            for norm_name, display_name in self._display_names.items()
+        }
 
     def to_dict(self) -> List[dict]:
         """Convert all events to a dictionary format"""
@@ -460,19 +679,19 @@ class EventLog:
 # Create a global config instance
 bot_config = BotConfig()
 
-# Initialize the discord intent object and set most of the necessary parameters from the docs of "discord" to True
-intents = discord.Intents.default()
-
-# Required for commands and reading messages
-intents.message_content = True
-
-# required for reactions, member ids/names and the guild/clan itself
-intents.reactions = True
-intents.members = True
-intents.guilds = True
-
-# needed to receive message + reaction payloads
-intents.messages = True
+# Initialize the discord intent object in one go, on top of the default intents, with most of the necessary parameters from the docs of
+# "discord" set to True
+intents = discord.Intents(
+    discord.Intents.default().value,
+    # Required for commands and reading messages
+    message_content=True,
+    # required for reactions, member ids/names and the guild/clan itself
+    reactions=True,
+    members=True,
+    guilds=True,
+    # needed to receive message + reaction payloads
+    messages=True,
+)
 
 # get the bot commands in a variable with the usual / standard prefix
 bot = commands.Bot(command_prefix="/", intents=intents)
@@ -483,23 +702,42 @@ attendance_log = AttendanceLog()
 # Holds data for the most recent 8 Apollo events
 event_log = EventLog()  # Populate this in the /scan_apollo command
 
+
+class _PunctuationTable(dict):
+    """
+    str.translate table dropping punctuation, i.e. everything the regex [^\w\s] would match.
+
+    string.punctuation only covers ASCII, so instead of listing every character up front, each code point is classified the first time it
+    shows up and remembered afterwards.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        char = chr(codepoint)
+        value = char if char.isalnum() or char == "_" or char.isspace() else None
+        self[codepoint] = value
+        return value
+
+
+_STRIP_PUNCTUATION = _PunctuationTable()
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
-    """ Using regex, we normalize scanned names to pass into other functions. """
-    name = name.lower()
-    name = re.sub(r"[^\w\s]", "", name)  # remove punctuation
-    name = re.sub(r"\s+", " ", name)     # normalize whitespace
-    return name.strip()
+    """ We normalize scanned names to pass into other functions. Rosters repeat across events, so results are cached. """
+    # remove punctuation with one translate pass, split() then collapses whitespace runs and strips the ends at the same time
+    return " ".join(name.lower().translate(_STRIP_PUNCTUATION).split())
 
 
-async def defer_response(interaction: discord.Interaction, *, thinking: bool = True) -> None:
+async def defer_response(interaction: discord.Interaction, *, thinking: bool = True, ephemeral: bool = False) -> None:
     """
     Utility method to handle response deferral with proper typing.
 
     Args:
         interaction: The Discord interaction to defer
         thinking: Whether to show the "thinking" state (default: True)
+        ephemeral: Whether the deferred response should be ephemeral (default: False)
     """
-    await interaction.response.defer(thinking=thinking) # type: ignore[attr-defined]
+    await interaction.response.defer(thinking=thinking, ephemeral=ephemeral) # type: ignore[attr-defined]
 
 
 async def send_response(interaction: discord.Interaction, content: str, *, ephemeral: bool = False) -> None:
@@ -516,6 +754,87 @@ async def send_response(interaction: discord.Interaction, content: str, *, ephem
     else:
         await interaction.response.send_message(content, ephemeral=ephemeral)# type: ignore[attr-defined]
 
+
+def pack_chunks(parts: Iterable[str], *, separator: str = "\n\n", limit: int = _CHUNK_LIMIT) -> List[str]:
+    """
+    Utility method to pack message parts into chunks under Discord's message size limit.
+
+    Parts are never split, a part is only moved to the next chunk when appending it would exceed the limit.
+
+    Args:
+        parts: The message parts to pack, in order
+        separator: The text appended after each part (default: a blank line)
+        limit: The maximum size of a chunk (default: _CHUNK_LIMIT)
+
+    Returns:
+        List of chunks ready to be sent in order
+    """
+    chunks = []
+    buf = []
+    size = 0
+    for part in parts:
+        if buf and size + len(part) > limit:
+            chunks.append("".join(buf))
+            buf.clear()
+            size = 0
+        buf.append(part)
+        buf.append(separator)
+        size += len(part) + len(separator)
+
+    if buf:
+        chunks.append("".join(buf))
+    return chunks
+
+
+async def iter_apollo(channel: discord.abc.Messageable, limit: int) -> AsyncIterator[discord.Message]:
+    """
+    Utility method to iterate over the recent messages of a channel that were posted by Apollo.
+
+    Args:
+        channel: The channel whose history is scanned
+        limit: The number of recent messages to scan
+
+    Yields:
+        Every message within the limit whose author name is one of the configured Apollo author names, or contains "apollo"
+        (case-insensitive) if none are configured
+    """
+    # with exact names configured, rejecting all the other messages is a single set lookup
+    author_names = bot_config.APOLLO_AUTHOR_NAMES
+    if author_names:
+        async for msg in channel.history(limit=limit):
+            if msg.author.name in author_names:
+                yield msg
+        return
+
+    async for msg in channel.history(limit=limit):
+        if _APOLLO_RE.search(msg.author.name):
+            yield msg
+
+
+async def fetch_reaction_display_names(reaction: discord.Reaction, members_by_id: Dict[int, discord.Member]) -> Tuple[str, List[str]]:
+    """
+    Utility method to stream the users who reacted with a reaction, keeping the display names of everyone but bots.
+
+    Args:
+        reaction: The reaction to fetch the users of
+        members_by_id: The guild members by user ID, used to resolve server display names
+
+    Returns:
+        Tuple of the reaction emoji as a string and the display names of the users who reacted with it, one per reaction
+    """
+    display_names = []
+    async for user in reaction.users():
+        # Only consider users, not bots
+        if user.bot:
+            continue
+
+        # set a var member, using the guild members of Discord's guild object for that user.id, also set display_name to that member
+        # display name, if the user is a member, else just get the discord username (because nickname for non-members might not be set)
+        member = members_by_id.get(user.id)
+        display_names.append(member.display_name if member else user.name)
+
+    return str(reaction.emoji), display_names
+
 @bot.event
 async def on_ready():
     """
@@ -540,6 +859,12 @@ async def on_ready():
         "guild-name": bot.guilds,
     })
     LOG.info("Bot is running on version %s" % discord.__version__)
+
+    # CHANNEL_ID is already an int, so the channel can be resolved once here instead of with every scan
+    bot_config._target_channel = bot.get_channel(bot_config.CHANNEL_ID)
+    if bot_config._target_channel is None:
+        LOG.error("Failed to fetch the announcements channel.", extra={"bot.channel_id": bot_config.CHANNEL_ID})
+
     try:
         synced = await bot.tree.sync()
         LOG.info(f"Synced commands: {synced}")
@@ -597,17 +922,24 @@ async def show_apollo_embeds(interaction: discord.Interaction, limit: int = 50):
 
     found = 0
     limit = min(limit, 200)
+    descriptions = []
+
+    # scanning and sending can take longer than Discord waits for the first response, so acknowledge the command right away
+    await defer_response(interaction, ephemeral=True)
+
+    async for msg in iter_apollo(interaction.channel, limit):
+        found += 1
+        for embed in msg.embeds:
+            descriptions.append(f"Embed description:\n```{embed.description}```")
 
-    async for msg in interaction.channel.history(limit=limit):
-        if "Apollo" in msg.author.name:
-            found += 1
-            for embed in msg.embeds:
-                await interaction.channel.send(f"Embed description:\n```{embed.description}```")
+    # Send the collected descriptions in as few messages as possible
+    for chunk in pack_chunks(descriptions):
+        await interaction.channel.send(chunk)
 
     if found == 0:
-        await send_response(interaction,f"No Apollo messages found in last {limit} messages.")
+        await interaction.followup.send(f"No Apollo messages found in last {limit} messages.")
     else:
-        await send_response(interaction,f"Found {found} Apollo messages.", ephemeral=True)
+        await interaction.followup.send(f"Found {found} Apollo messages.")
 
 
 # let's list recent messages and their authors
@@ -615,11 +947,10 @@ async def show_apollo_embeds(interaction: discord.Interaction, limit: int = 50):
 @app_commands.describe(limit="Number of messages to scan (default 20)")
 async def recent_authors(interaction: discord.Interaction, limit: int = 20):
 
-    authors = set()
     limit = min(limit, 200)
 
-    async for msg in interaction.channel.history(limit=limit):
-        authors.add(msg.author.name)
+    # a dict used as an ordered set, so every author is listed once and in the order they last posted, newest first
+    authors = {msg.author.name: None async for msg in interaction.channel.history(limit=limit)}
 
     result = ", ".join(authors)
     await send_response(interaction,
@@ -667,8 +998,7 @@ async def staff_meeting_notes(interaction: discord.Interaction):
     await defer_response(interaction)  # defer in case it takes a moment
 
     try:
-        with open(bot_config.TEMPLATE_PATH, 'r', encoding='utf-8') as file:
-            notes_text = file.read()
+        notes_text = bot_config.get_template()
 
         if not notes_text.strip():
             await interaction.followup.send("Error: Template file is empty!")
@@ -694,25 +1024,23 @@ async def debug_apollo(interaction: discord.Interaction, limit: int = 50):
     found = False
     messages = []
 
-    async for msg in interaction.channel.history(limit=limit):
-
-        if "apollo" in msg.author.name.lower():
-            found = True
+    async for msg in iter_apollo(interaction.channel, limit):
+        found = True
 
-            if not msg.embeds:
-                messages.append("Apollo message found, but has no embeds.")
-                continue
+        if not msg.embeds:
+            messages.append("Apollo message found, but has no embeds.")
+            continue
 
-            for embed in msg.embeds:
-                title = embed.title or "No Title"
-                description = embed.description or "No Description"
-                messages.append(f"**Embed Title:** {title}\n```{description}```")
+        for embed in msg.embeds:
+            title = embed.title or "No Title"
+            description = embed.description or "No Description"
+            messages.append(f"**Embed Title:** {title}\n```{description}```")
 
-                for field in embed.fields:
-                    name = field.name or "Unnamed Field"
-                    value = field.value or "No Value"
-                    chunk = f"**{name}**:\n```{value}```"
-                    messages.append(chunk)
+            for field in embed.fields:
+                name = field.name or "Unnamed Field"
+                value = field.value or "No Value"
+                chunk = f"**{name}**:\n```{value}```"
+                messages.append(chunk)
 
     if not found:
         await interaction.followup.send("No Apollo messages found in recent history.")
@@ -722,30 +1050,15 @@ async def debug_apollo(interaction: discord.Interaction, limit: int = 50):
         await interaction.followup.send("Apollo messages found, but no embeds to show.")
         return
 
-    # Send messages in chunks under 1900 characters
-    chunk = ""
-    for msg in messages:
-        if len(chunk) + len(msg) > 1900:
-            await interaction.followup.send(chunk)
-            chunk = ""
-        chunk += msg + "\n\n"
-
-    if chunk:
+    # Send messages in chunks under the chunk limit
+    for chunk in pack_chunks(messages):
         await interaction.followup.send(chunk)
 
 
 @bot.tree.command(name="debug_duplicates", description="Check for inconsistent (duplicate-looking) usernames in attendance log.")
 async def debug_duplicates(interaction: discord.Interaction):
-    from collections import defaultdict
-
-    seen = defaultdict(set)
-
-    # Normalize usernames and group them
-    for entry in attendance_log.get_all_entries():
-        normalized = normalize_name(entry.username)
-        seen[normalized].add(entry.username)
-
-    duplicates = {k: v for k, v in seen.items() if len(v) > 1}
+    # The attendance log groups usernames by their normalized form as they are logged, so there is nothing to re-scan here
+    duplicates = attendance_log.get_username_variants()
 
     # Defer in case it takes time
     await defer_response(interaction)
@@ -756,46 +1069,46 @@ async def debug_duplicates(interaction: discord.Interaction):
         lines = ["Inconsistent usernames found:"]
         for k, versions in duplicates.items():
             lines.append(f"{k}: {', '.join(versions)}")
-        
-        message = "\n".join(lines)
-        if len(message) > 1900:
-            for chunk in [message[i:i+1900] for i in range(0, len(message), 1900)]:
-                await interaction.followup.send(chunk)
-        else:
-            await interaction.followup.send(message)
 
+        # pack whole lines into chunks, instead of joining everything and slicing lines apart
+        for chunk in pack_chunks(lines, separator="\n"):
+            await interaction.followup.send(chunk)
 
-# command to gather Apollo data, cause its fucking CLOSED SOURCE!!
-@bot.tree.command(name="scan_apollo", description="Scan Apollo event embeds and log attendance.")
-@app_commands.describe(limit="Number of messages to scan (default 18, max 100)")
-async def scan_apollo(interaction: discord.Interaction, limit: int = 18):
 
-    # initialize scanned and logged as 0
-    scanned = 0
-    logged = 0
+@functools.lru_cache(maxsize=256)
+def roster_kind(field_name: str) -> Optional[str]:
+    """
+    Classify an embed field by its name. Apollo reuses the same few field names across events, so results are cached.
 
-    # limit the apollo scans to a max of 100
-    limit = min(limit, 100)
+    Args:
+        field_name: The name of the embed field
 
-    # Ensure CHANNEL_ID is int or convert
-    # also, if you don't want to hard-code the channel id and instead want to type the channel id as an argument to the command, you can do so
-    target_channel = bot.get_channel(int(bot_config.CHANNEL_ID))
-    if not target_channel:
-        await send_response(interaction,"Failed to fetch the announcements channel.")
-        return
+    Returns:
+        "accepted" or "declined" for the roster fields, a field named just like the ❌ emoji counts as declined, None for any other field
+    """
+    field_name = field_name.lower()
+    if "accepted" in field_name:
+        return "accepted"
+    if "declined" in field_name or field_name.strip() in _DECLINED_FIELD_NAMES:
+        return "declined"
+    return None
 
-    # the thinking is "the bot is thinking", which is set to true
-    await defer_response(interaction, thinking=True)
 
-    # NOTE -> here on, we will be focusing on scanning the actual apollo messages
+def parse_apollo_messages(messages: List[Tuple[int, List[discord.Embed]]]) -> List[EventEntry]:
+    """
+    Parse the attendees and declined users out of the embeds of Apollo messages.
 
-    # for every message in the target channel, with the current limit of how many prior messages to scan, we will check if it's a message by apollo first
-    async for msg in target_channel.history(limit=limit):
-        if "Apollo" not in msg.author.name:
-            continue
-        
-        # if it is an apollo, increment scanned messages count by 1
-        scanned += 1
+    This is plain CPU work without any Discord I/O, so /scan_apollo runs it in a worker thread to keep the event loop free.
+
+    Args:
+        messages: Tuples of the message ID and the embeds of every scanned Apollo message
+
+    Returns:
+        List of event entries, one per embed
+    """
+    events = []
+
+    for event_id, embeds in messages:
 
         # ---- NOTE ----
         # the way Apollo does its ✅, ❌ for example, is not the actual emoji, that would be :white_check_mark: and :x: . Rather, apollo has its own
@@ -821,71 +1134,107 @@ async def scan_apollo(interaction: discord.Interaction, limit: int = 18):
 
         # then for each embed in the message embeds, set a list of what embed we want to keep track of i.e.: here we keep track of attendees and declined,
         # but that goes for literally anything else, using any other of apollo's function, that's why the "/show_apollo_embeds" function exists,
-        # So we are looping through all embed objects attached to a single message 'msg'
-        for embed in msg.embeds:
-            attendees = []
-            declined = []
+        # So we are looping through all embed objects attached to a single message
+
+        # debug loop for seeing the exact inner workings of the bot embeds in JSON like format, once per message and only if debug logging is on
+        if LOG.isEnabledFor(logging.DEBUG):
+            for debug_embed in embeds:
+                LOG.debug("Embed: %s", debug_embed)
+
+        for embed in embeds:
+            # the normalized form of each name mapped to its pretty name, a dict also gives O(1) lookups by normalized name later on
+            attendees: Dict[str, str] = {}
+            declined: Dict[str, str] = {}
+            rosters = {"accepted": attendees, "declined": declined}
 
             # then for each field in the embeds' fields, check for both accepted and declined
             # embed.fields is a list of named fields in that embed (e.g., "Accepted", "Declined").
             for field in embed.fields:
 
-                # strip them of their standard apollo format and append the plain names to the attendees dict, do the same for declined
-                # parse the .value of each field to extract usernames by "normalizing" them
-                if "accepted" in field.name.lower():
-                    for line in field.value.split("\n"):
-                        name = line.strip("- ").strip()
-                        if name:
-                            attendees.append(name)
+                # pick the dict the field belongs to, other fields are skipped
+                target = rosters.get(roster_kind(field.name))
+                if target is None:
+                    continue
 
-                if "declined" in field.name.lower() or "x" in field.name.lower():
-                    for line in field.value.split("\n"):
-                        name = line.strip("- ").strip()
-                        if name:
-                            declined.append(name)
+                # strip them of their standard apollo format and add the plain names to the attendees dict, do the same for declined
+                # parse the .value of each field to extract usernames and "normalize" them right away, calling the normalize_name function on
+                # them to well... normalize them, the same name listed twice just ends up under the same key
+                target.update((normalize_name(name), name) for name in _ROSTER_LINE_RE.findall(field.value))
 
             # the embed object description is how the bot parses each description for each line in the description of event but remember:
-            # this condition is outside the field loop, but inside the main msg embed loop, so the description embed here is for this specific use case,
+            # this condition is outside the field loop, but inside the main embed loop, so the description embed here is for this specific use case,
             # showing the attendees
             if embed.description:
-                for line in embed.description.split("\n"):
-                    if line.strip().startswith("-"):
-                        name = line.strip("- ").strip()
-                        if name:
-                            attendees.append(name)
-
-            # debug loop for seeing the exact inner workings of the bot embeds in JSON like format
-            for debugEmbed in msg.embeds:
-                logging.info(f"Embed: {debugEmbed}")
-
-            # we then want to get tuples of the names in each of the 2 lists we have so far, and call the normalized_name function on it,
-            # to well... normalize them using list iteration
-            normalized_declined = [(normalize_name(name), name) for name in declined]
-            normalized_attendees = [(normalize_name(name), name) for name in attendees]
-
-            # append the MAIN list, at global level which is keeping track of mapping the attributes to the id's like we see below
-            event = EventEntry(
-                event_id=msg.id,
-                accepted=normalized_attendees,
-                declined=normalized_declined
-            )
-            event_log.add_event(event)
-
-            # now im "pretty printing" it, so I don't want to see ".username_x" but their actual server name like in a milsim server (Pvt M. Cooper)
-            # for every user_id and pretty name in each of the lists i.e., "attendees" and "declined", we first want to check if they are already logged
-            # by calling the "already_logged" function with the "pseudo_id" to prevent duplicates, and if that's not the case, we append logged by 1
-            for user_id, pretty in normalized_attendees:
-                pseudo_id = f"{msg.id}-{user_id}"
-                if not attendance_log.already_logged(pseudo_id):
-                    attendance_log.log_attendance(user_id, pretty, msg.id)
-                    logged += 1
-
-            # fore declined we do the same, but we pass the response parameter and check for all declined users
-            for user_id, pretty in normalized_declined:
-                pseudo_id = f"{msg.id}-{user_id}-declined"
-                if not attendance_log.already_logged(pseudo_id):
-                    attendance_log.log_attendance(user_id, pretty, msg.id, response="declined")
-                    logged += 1
+                attendees.update((normalize_name(name), name) for name in _DESCRIPTION_ROSTER_LINE_RE.findall(embed.description))
+
+            # collect the event for the MAIN list, at global level which is keeping track of mapping the attributes to the id's,
+            # all events of the scan are added to it in one go once the scan is done
+            events.append(EventEntry(
+                event_id=event_id,
+                accepted=attendees,
+                declined=declined
+            ))
+
+    return events
+
+
+# command to gather Apollo data, cause its fucking CLOSED SOURCE!!
+@bot.tree.command(name="scan_apollo", description="Scan Apollo event embeds and log attendance.")
+@app_commands.describe(limit="Number of messages to scan (default 18, max 100)")
+async def scan_apollo(interaction: discord.Interaction, limit: int = 18):
+
+    # initialize logged as 0
+    logged = 0
+
+    # limit the apollo scans to a max of 100
+    limit = min(limit, 100)
+
+    # the target channel is resolved from CHANNEL_ID once the bot is ready, if it wasn't in the cache back then we look it up again and keep it
+    # also, if you don't want to hard-code the channel id and instead want to type the channel id as an argument to the command, you can do so
+    target_channel = bot_config._target_channel
+    if target_channel is None:
+        target_channel = bot_config._target_channel = bot.get_channel(bot_config.CHANNEL_ID)
+    if not target_channel:
+        await send_response(interaction,"Failed to fetch the announcements channel.")
+        return
+
+    # the thinking is "the bot is thinking", which is set to true
+    await defer_response(interaction, thinking=True)
+
+    # NOTE -> here on, we will be focusing on scanning the actual apollo messages
+
+    # for every message in the target channel, with the current limit of how many prior messages to scan, iter_apollo only hands us the ones
+    # posted by apollo, we collect them first and count them as scanned
+    apollo_messages = [(msg.id, msg.embeds) async for msg in iter_apollo(target_channel, limit)]
+    scanned = len(apollo_messages)
+
+    # parsing the embeds is CPU work, so for larger scans it runs in a worker thread to keep the bot responsive to other commands in the meantime
+    if sum(len(embeds) for _, embeds in apollo_messages) >= _THREADED_PARSE_MIN_EMBEDS:
+        pending_events = await asyncio.to_thread(parse_apollo_messages, apollo_messages)
+    else:
+        pending_events = parse_apollo_messages(apollo_messages)
+
+    # every entry of this scan shares one timestamp, instead of formatting the current time again for every single attendee
+    scan_time = datetime.now().isoformat()
+
+    for event in pending_events:
+
+        # now im "pretty printing" it, so I don't want to see ".username_x" but their actual server name like in a milsim server (Pvt M. Cooper)
+        # for every user_id and pretty name in each of the lists i.e., "attendees" and "declined", we first want to check if they are already logged
+        # by calling the "already_logged" function with the (event, user, response) key to prevent duplicates, and if that's not the case,
+        # we append logged by 1
+        for user_id, pretty in event.accepted.items():
+            if not attendance_log.already_logged((event.event_id, user_id, "accepted")):
+                attendance_log.log_attendance(user_id, pretty, event.event_id, timestamp=scan_time)
+                logged += 1
+
+        # fore declined we do the same, but we pass the response parameter and check for all declined users
+        for user_id, pretty in event.declined.items():
+            if not attendance_log.already_logged((event.event_id, user_id, "declined")):
+                attendance_log.log_attendance(user_id, pretty, event.event_id, response="declined", timestamp=scan_time)
+                logged += 1
+
+    event_log.add_events(pending_events)
 
     await interaction.followup.send(
         f"Scanned {scanned} Apollo events, logged {logged} attendees (limit: {limit})."
@@ -899,32 +1248,32 @@ async def scan_all_reactions(interaction: discord.Interaction, limit: app_comman
 
     await defer_response(interaction,thinking=True)  # defer in case it takes a moment
 
-    # initialize scanned to 0, and a dict of emoji lists
-    scanned = 0
-    emoji_summary = defaultdict(list)
-
-    # we want to check every message in the channel this command is made in, and for every message amount mentioned when making the "/command",
-    # increment the scanned counter
-    async for msg in interaction.channel.history(limit=limit):
-        scanned += 1
+    # initialize a dict of emoji sets holding the unique display names and a counter of reactions per emoji
+    emoji_summary: Dict[str, Set[str]] = defaultdict(set)
+    emoji_counts: Counter = Counter()
 
-        # then for every reaction in the messages we scanned, set the users to a list of all users who have reacted to store reactions
-        for reaction in msg.reactions:
+    # we want to check every message in the channel this command is made in, for every message amount mentioned when making the "/command",
+    # so collect them first and count them as scanned
+    messages = [msg async for msg in interaction.channel.history(limit=limit)]
+    scanned = len(messages)
 
-            users = [user async for user in reaction.users()]
+    # look the members up in a dict built once, instead of calling into the guild for every single reactor
+    members_by_id = {member.id: member for member in interaction.guild.members}
 
-            # Only consider users, not bots
-            for user in users:
-                if user.bot:
-                    continue
+    # then for every reaction in the messages we scanned, get the display names of all users who have reacted to store reactions, the users are
+    # streamed without keeping them around, and all reactions are fetched concurrently so the requests to Discord don't wait on each other
+    results = await asyncio.gather(*(
+        fetch_reaction_display_names(reaction, members_by_id) for msg in messages for reaction in msg.reactions
+    ))
 
-                # set a var member, using Discord's guild object and use the get_member method for that user.id, also set display_name to that member
-                # display name, if the user is a member, else just get the discord username (because nickname for non-members might not be set)
-                member = interaction.guild.get_member(user.id)
-                display_name = member.display_name if member else user.name
+    for emoji_key, display_names in results:
+        if not display_names:
+            continue
 
-                # append the emoji summary dict with a string representation of the reaction emojis like ":x:, :white_check_mark: ..." on the display_name
-                emoji_summary[str(reaction.emoji)].append(display_name)
+        # add the display names to the emoji summary dict under a string representation of the reaction emojis like ":x:, :white_check_mark: ..."
+        # the set drops duplicates right away, the count still includes every reaction
+        emoji_summary[emoji_key].update(display_names)
+        emoji_counts[emoji_key] += len(display_names)
 
     if not emoji_summary:
         await interaction.followup.send(f"No reactions found in the last {limit} messages.")
@@ -933,16 +1282,14 @@ async def scan_all_reactions(interaction: discord.Interaction, limit: app_comman
     # set a list of lines as an f string to show number of scanned messages
     lines = [f"**Reactions Summary (from last {scanned} messages)**\n"]
 
-    # then for each emoji, user in the emoji_summary dict (we are unpacking the dict, using .items() to index into the dict)
-    for emoji, users in emoji_summary.items():
-
-        # get a set of unique users
-        unique_users = set(users)
+    # then for each emoji, users in the emoji_summary dict (we are unpacking the dict, using .items() to index into the dict)
+    for emoji, unique_users in emoji_summary.items():
 
         # append the 'lines' list with the f string of each emoji, mapped to each set of users
-        lines.append(f"{emoji} - {len(users)} reaction(s) from: {', '.join(unique_users)}")
+        lines.append(f"{emoji} - {emoji_counts[emoji]} reaction(s) from: {', '.join(unique_users)}")
 
-    await interaction.followup.send("\n".join(lines))
+    for chunk in pack_chunks(lines, separator="\n"):
+        await interaction.followup.send(chunk)
 
 
 # The command to show the leaderboard
@@ -960,47 +1307,38 @@ async def leaderboard(interaction: discord.Interaction):
     # Get participation summary
     participation_data = event_log.get_all_participants()
 
-    # Sort users by accepted count (descending)
-    sorted_participants = sorted(
-        participation_data.items(),
-        key=lambda x: (-x[1]["accepted"], x[1]["display_name"])
-    )
+    # Sort users by accepted count (descending), then display name, the sort keys are pulled out into the rows once so the default tuple
+    # ordering can be used, user_id is unique so the stats themselves are never compared
+    rows = [(-stats["accepted"], stats["display_name"], user_id, stats) for user_id, stats in participation_data.items()]
+    rows.sort()
 
     # Format leaderboard
     lines = [f"**Attendance Leaderboard {datetime.now().strftime('%B')}**"]
     total_events = event_log.total_events
 
+    # Split the participants into the ranked attendees and the declined-only users in a single pass
+    accepted_lines = []
+    declined_lines = []
+    for neg_accepted, display_name, user_id, stats in rows:
+        if neg_accepted:
+            accepted_lines.append(f"{len(accepted_lines) + 1}. **{display_name}** - {-neg_accepted}/{total_events} events ✅")
+        elif stats["declined"] > 0:
+            declined_lines.append(f"{len(declined_lines) + 1}. **{display_name}** - {stats['declined']} declines ❌")
+
     # Add each participant's stats
-    for i, (user_id, stats) in enumerate(sorted_participants, start=1):
-        display_name = stats["display_name"]
-        accepted = stats["accepted"]
-        lines.append(f"{i}. **{display_name}** - {accepted}/{total_events} events ✅")
+    lines.extend(accepted_lines)
 
     # Add declined-only users
-    declined_only = [
-        (user_id, stats) for user_id, stats in sorted_participants
-        if stats["accepted"] == 0 and stats["declined"] > 0
-    ]
-
-    if declined_only:
+    if declined_lines:
         lines.append(f"\n**Declined (❌)**")
-        for i, (user_id, stats) in enumerate(declined_only, start=1):
-            display_name = stats["display_name"]
-            declined = stats["declined"]
-            lines.append(f"{i}. **{display_name}** - {declined} declines ❌")
+        lines.extend(declined_lines)
 
     # Add total unique responders
     lines.append(f"\nTotal unique responders: {len(participation_data)}")
 
-    # Send the message
-    message = "\n".join(lines)
-    await defer_response(interaction, thinking=True)
-
-    if len(message) > 1900:
-        for chunk in [message[i:i + 1900] for i in range(0, len(message), 1900)]:
-            await interaction.followup.send(chunk)
-    else:
-        await interaction.followup.send(message)
+    # Send the message, split on line boundaries if it's too long, the interaction has already been deferred above
+    for chunk in pack_chunks(lines, separator="\n"):
+        await interaction.followup.send(chunk)
 
 
 
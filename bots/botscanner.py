@@ -1,8 +1,13 @@
+import asyncio
 import discord
 import csv
+import hashlib
+import heapq
+import json
 import os
+import re
 from datetime import datetime
-from discord.ext import commands
+from discord.ext import commands, tasks
 from collections import defaultdict
 
 
@@ -17,6 +22,7 @@ TOKEN = "your token here"
 GUILD_ID = "your discord server/guild id"
 CHANNEL_ID = "the channel id where you want the bot to scan"  # optional, you could just make the bot commands in the target channel but that can get messy
 REACTION_EMOJI = "✅"
+APOLLO_BOT_ID = 475744554910351370  # Apollo's bot user id, messages are matched by author id instead of searching the author name
 
 # Initialize the discord intent object and set most needed paramters from the docs of "discord" to True
 intents = discord.Intents.default()
@@ -32,8 +38,27 @@ intents.guilds = True
 # needed to receive message + reaction payloads
 intents.messages = True
 
+# the bot writes whatever attendance rows are still queued before it disconnects, so a shutdown doesn't lose them
+class ScannerBot(commands.Bot):
+    async def close(self):
+        flush_pending_rows.stop()
+        await write_pending_rows()
+        await super().close()
+
+
 # get the bot commands in a variable with usual/standard prefix
-bot = commands.Bot(command_prefix="/", intents=intents)
+bot = ScannerBot(command_prefix="/", intents=intents)
+
+# roster lines of Apollo embeds, a name without the dashes and whitespace around it, compiled once and run over a whole field with findall
+# [^\S\n] is any whitespace but a line break, unicode spaces too: "- Bob\xa0" -> "Bob", "- Pvt Ray\u3000" -> "Pvt Ray", "- Jane\u2009" -> "Jane"
+# the description variant only takes lines starting with "-"
+_LINE_RE = re.compile(r"^(?:[^\S\n]|-)*(.*?[^-\s])(?:[^\S\n]|-)*$", re.MULTILINE)
+_DESCRIPTION_LINE_RE = re.compile(r"^[^\S\n]*-(?:[^\S\n]|-)*(.*?[^-\s])(?:[^\S\n]|-)*$", re.MULTILINE)
+
+
+# buffer sizes for the csv files, a whole month of attendance is read with a few large reads instead of many 8 KiB ones
+CSV_READ_BUFFER = 1 << 20
+CSV_WRITE_BUFFER = 1 << 16
 
 
 # Get the csv file number and use the datetime lib to get time of all during command and return the f string thereof
@@ -42,48 +67,179 @@ def get_csv_filename():
     return f"attendance_{now.year}_{now.month:02}.csv"
 
 
-# already logged function that removes duplicates
-def already_logged(pseudo_id, message_id):
-    filename = get_csv_filename()
+# load the (UserID, EventID, Response) keys of everything that's already logged, used to remove duplicates
+# the file is read once per scan, so checking an attendee is a set lookup instead of re-reading the whole file every time
+def load_logged_keys(filename):
     if not os.path.isfile(filename):
-        return False
-    with open(filename, newline="", encoding="utf-8") as file:
-        reader = csv.DictReader(file)
-        # Use "EventID" instead of "MessageID"
-        return any(
-            row["UserID"] == pseudo_id and row["EventID"] == str(message_id)
-            for row in reader
-        )
+        return set()
+    with open(filename, newline="", encoding="utf-8", buffering=CSV_READ_BUFFER) as file:
+        reader = csv.reader(file)
+        # skip the header, the columns are Timestamp, UserID, Username, EventID, Response
+        next(reader, None)
+        return {(row[1], row[3], row[4]) for row in reader if len(row) >= 5}
 
 
-# now log user's attendance to the filename
-def log_attendance(user_id, username, event_id, response="accepted"):
-    filename = get_csv_filename()
+# read the accepted and declined event IDs of every user from the filename, together with their pretty usernames
+def load_attendance(filename):
+    attendance = defaultdict(set)  # user_id -> set of accepted event IDs
+    declined = defaultdict(set)  # user_id -> set of declined event IDs
+    usernames = {}  # user_id -> pretty username
+
+    with open(filename, newline="", encoding="utf-8", buffering=CSV_READ_BUFFER) as file:
+        # read the rows as plain lists and index the columns, instead of building a dict for every row
+        reader = csv.reader(file)
+        # skip the header, the columns are Timestamp, UserID, Username, EventID, Response
+        next(reader, None)
+        for row in reader:
+            # unpack the usual 5 columns straight into locals
+            if len(row) == 5:
+                _, _, raw_username, event_id, response = row
+            elif len(row) > 3:
+                # rows with a missing or extra column, a missing Response counts as accepted
+                raw_username, event_id = row[2], row[3]
+                response = row[4] if len(row) > 4 else "accepted"
+            else:
+                continue
+            raw_username = raw_username.strip()
+            user_id = raw_username.lower()
+            event_id = event_id.strip()
+            response = response.lower()
+
+            # the pretty username is only stored the first time we see a user
+            if user_id not in usernames:
+                usernames[user_id] = raw_username
+            if response == "accepted":
+                attendance[user_id].add(event_id)
+            elif response == "declined":
+                declined[user_id].add(event_id)
+
+    return attendance, declined, usernames
+
+
+# now log a batch of attendance rows (Timestamp, UserID, Username, EventID, Response) to the filename, opening the file once for all of them
+def log_attendance_batch(filename, rows):
+    if not rows:
+        return
+
     file_exists = os.path.isfile(filename)
 
-    with open(filename, "a", newline="", encoding="utf-8") as file:
+    with open(filename, "a", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER) as file:
         writer = csv.writer(file)
 
         # Write header only if file does not exist yet
         if not file_exists:
             writer.writerow(["Timestamp", "UserID", "Username", "EventID", "Response"])
 
-        # Write attendance data row
-        writer.writerow(
-            [datetime.now().isoformat(), user_id, username, event_id, response]
-        )
+        # Write attendance data rows
+        writer.writerows(rows)
+
+
+# the hashes of the Apollo messages scanned into a monthly file are kept next to it, attendance_2024_06.csv -> attendance_2024_06_scanned.json
+def get_scanned_filename(filename):
+    return f"{os.path.splitext(filename)[0]}_scanned.json"
+
+
+# load the {message id: content hash} of the Apollo messages already scanned into the filename
+def load_scanned_hashes(filename):
+    # the hashes only mean something as long as the rows they stand for are still in the csv file
+    if not os.path.isfile(filename):
+        return {}
+    try:
+        with open(get_scanned_filename(filename), encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+# save the content hashes of the scanned Apollo messages next to the filename
+def save_scanned_hashes(filename, scanned_hashes):
+    with open(get_scanned_filename(filename), "w", encoding="utf-8") as file:
+        json.dump(scanned_hashes, file)
+
+
+# hash what scan_apollo reads from a message's embeds, the built-in hash() changes with every restart so a real digest is used instead
+def embeds_hash(embeds):
+    content = [(embed.description, [(field.name, field.value) for field in embed.fields]) for embed in embeds]
+    return hashlib.sha1(json.dumps(content).encode("utf-8")).hexdigest()
+
+
+# in-memory (UserID, EventID, Response) keys of every monthly file, read from the file the first time they're needed and kept up to date
+# as we log, so neither the reaction listener nor the scans have to read the file again
+logged_keys_by_file = {}
+
+# rows that are logged but not written yet, per monthly file. Everything is written by write_pending_rows, one batch per file
+pending_rows_by_file = defaultdict(list)
+
+# only one batch is written at a time, so rows of two batches never end up interleaved in the file
+write_lock = asyncio.Lock()
+
+
+# get the logged keys of the filename, the file is only read (in a worker thread) the first time
+async def get_logged_keys(filename):
+    logged_keys = logged_keys_by_file.get(filename)
+    if logged_keys is None:
+        logged_keys = await asyncio.to_thread(load_logged_keys, filename)
+        # another command may have loaded them while we were waiting on the file
+        logged_keys = logged_keys_by_file.setdefault(filename, logged_keys)
+    return logged_keys
+
+
+# write all pending rows to their files, the file I/O runs in a worker thread so the bot keeps answering Discord in the meantime
+# returns False if a file couldn't be written, its rows stay queued for the next try
+async def write_pending_rows():
+    written = True
+    async with write_lock:
+        for filename in list(pending_rows_by_file):
+            # take one file's rows at a time, rows logged while we write go into the next batch
+            rows = pending_rows_by_file.pop(filename)
+            try:
+                await asyncio.to_thread(log_attendance_batch, filename, rows)
+            except (OSError, csv.Error) as e:
+                # the file may be open (and locked) somewhere else, put the rows back in front of anything queued meanwhile
+                pending_rows_by_file[filename][:0] = rows
+                print(f"Couldn't write {filename}, keeping {len(rows)} rows for the next try: {e}")
+                written = False
+    return written
+
+
+# reactions come in one at a time, so their rows are written every 30 seconds instead of opening the file for every single one
+@tasks.loop(seconds=30)
+async def flush_pending_rows():
+    await write_pending_rows()
+
+
+# split the lines of a message into chunks under Discord's 2000 characters limit, without cutting a line in half
+def chunk_lines(lines, limit=1900):
+    chunks = []
+    buf = []
+    size = 0
+    for line in lines:
+        if buf and size + len(line) + 1 > limit:
+            chunks.append("\n".join(buf))
+            buf = []
+            size = 0
+        buf.append(line)
+        size += len(line) + 1
+    if buf:
+        chunks.append("\n".join(buf))
+    return chunks
 
 
 @bot.event
 async def on_ready():
     print(f"Bot is connected as {bot.user}")
 
+    # on_ready can fire again after a reconnect, the flush loop must only be started once
+    if not flush_pending_rows.is_running():
+        flush_pending_rows.start()
+
 
 """
 --- NOTE --- 
-This chunk of comments was for the async payload function, doesnt work for Apollo embeds but DOES if we want to use similar functionality in the future
-for normal emoji reactions to messages and log them
+The reaction listener doesnt work for Apollo embeds (that's what /scan_apollo is for) but DOES log normal emoji reactions to messages as they
+happen, so they don't need a history scan at all
 -----------------------------------------------------------------------------------------------------------------------------------------------------
+"""
 
 # Make an async function for the raw reaction transfer with its payload
     # we need to consider that we have to add the payload for every reaction, and the data we need for that is:
@@ -93,8 +249,6 @@ for normal emoji reactions to messages and log them
 
 @bot.event
 async def on_raw_reaction_add(payload):
-    print(f"Detected reaction: '{payload.emoji.name}'")
-
     if payload.emoji.name != REACTION_EMOJI:
         return
     if payload.channel_id != CHANNEL_ID:
@@ -104,14 +258,21 @@ async def on_raw_reaction_add(payload):
 
     # store the member and "guild" with their corresponding data in simpler vars then:
     guild = bot.get_guild(payload.guild_id)
-    member = guild.get_member(payload.user_id)
+    member = guild.get_member(payload.user_id) if guild else None
 
     # if the member is valid, log their attendance with needed params and print what they attended
+    # the row is only queued here, flush_pending_rows writes it with the others
     if member:
-        log_attendance(member.id, member.name, payload.message_id)
+        filename = get_csv_filename()
+        key = (str(member.id), str(payload.message_id), "accepted")
+        logged_keys = await get_logged_keys(filename)
+        if key in logged_keys:
+            return
+        logged_keys.add(key)
+        pending_rows_by_file[filename].append(
+            (datetime.now().isoformat(), member.id, member.name, payload.message_id, "accepted")
+        )
         print(f"{member.name} attended event {payload.message_id}")
------------------------------------------------------------------------------------------------------------------------------------------------------
-"""
 
 
 # This will print embed descriptions so we can see exactly what text is there (for reverse engineering websocket requests of other bots)
@@ -119,7 +280,7 @@ async def on_raw_reaction_add(payload):
 async def show_apollo_embeds(ctx):
     found = 0
     async for msg in ctx.channel.history(limit=50):
-        if "Apollo" in msg.author.name:
+        if msg.author.id == APOLLO_BOT_ID:
             found += 1
             for embed in msg.embeds:
                 await ctx.send(f"Embed description:\n```{embed.description}```")
@@ -157,7 +318,7 @@ async def halp(ctx):
 @bot.command()
 async def debug_apollo(ctx):
     async for msg in ctx.channel.history(limit=10):
-        if "Apollo" in msg.author.name:
+        if msg.author.id == APOLLO_BOT_ID:
             for embed in msg.embeds:
                 await ctx.send(
                     f"Embed title: {embed.title}\nDesc:\n```{embed.description}```"
@@ -180,11 +341,31 @@ async def scan_apollo(ctx):
         await ctx.send(f"Failed to fetch the announcements channel.")
         return
 
+    # the month's file is picked once, so a scan running over midnight at the end of the month doesn't get split across two files
+    filename = get_csv_filename()
+
+    # everything logged so far, shared with the reaction listener, keys of new rows are added as we go
+    logged_keys = await get_logged_keys(filename)
+
+    # the messages scanned before, if their embeds didn't change since then there is nothing new to log from them
+    scanned_hashes = await asyncio.to_thread(load_scanned_hashes, filename)
+    new_hashes = {}
+
+    # the new rows, written to the file in one go once the scan is done, they all share the time of the scan as their timestamp
+    pending_rows = []
+    scan_time = datetime.now().isoformat()
+
     async for msg in target_channel.history(limit=18):
-        if "Apollo" not in msg.author.name:
+        if msg.author.id != APOLLO_BOT_ID:
             continue
 
         scanned += 1
+
+        message_hash = embeds_hash(msg.embeds)
+        if scanned_hashes.get(str(msg.id)) == message_hash:
+            continue
+        new_hashes[str(msg.id)] = message_hash
+
         for embed in msg.embeds:
             attendees = []
             declined = []
@@ -192,48 +373,69 @@ async def scan_apollo(ctx):
             # Case 1: Look inside embed.fields for a field named like ":accepted:"
             for field in embed.fields:
                 if "accepted" in field.name.lower():
-                    for line in field.value.split("\n"):
-                        name = line.strip("- ").strip()
-                        if name:
-                            attendees.append(name)
+                    attendees.extend(_LINE_RE.findall(field.value))
 
                 if "declined" in field.name.lower() or "x" in field.name.lower():
-                    for line in field.value.split("\n"):
-                        name = line.strip("- ").strip()
-                        if name:
-                            declined.append(name)
+                    declined.extend(_LINE_RE.findall(field.value))
 
             # Case 2: Look inside embed.description (fallback)
             if embed.description:
-                lines = embed.description.split("\n")
-                for line in lines:
-                    if line.strip().startswith("-"):
-                        name = line.strip("- ").strip()
-                        if name:
-                            attendees.append(name)
-
-            # Log each attendee with pseudo ID
+                attendees.extend(_DESCRIPTION_LINE_RE.findall(embed.description))
+
+            # Log each attendee, keyed like the rows in the file (UserID, EventID, Response)
             for name in attendees:
-                pseudo_id = f"{msg.id}-{name}"
-                if not already_logged(pseudo_id, msg.id):
-                    log_attendance(
-                        name, name, msg.id
+                key = (name, str(msg.id), "accepted")
+                if key not in logged_keys:
+                    pending_rows.append(
+                        (scan_time, name, name, msg.id, "accepted")
                     )  # using 'name' as user_id and username, or Discord user ID if available
-                logged += 1
-            else:
-                print(f"Already logged: {name} with ID {pseudo_id}")
+                    logged_keys.add(key)
+                    logged += 1
+                else:
+                    print(f"Already logged: {name} for event {msg.id}")
 
             for name in declined:
-                pseudo_id = f"{msg.id}-{name}-declined"
-                if not already_logged(pseudo_id, msg.id):
-                    log_attendance(name, name, msg.id, response="declined")
+                key = (name, str(msg.id), "declined")
+                if key not in logged_keys:
+                    pending_rows.append(
+                        (scan_time, name, name, msg.id, "declined")
+                    )
+                    logged_keys.add(key)
                     logged += 1
                 else:
-                    print(f"Already logged: {name} with ID {pseudo_id}")
+                    print(f"Already logged: {name} declined event {msg.id}")
+
+    # queue the rows for the file and write them (along with any queued reactions) right away, the scan doesn't wait on the flush loop
+    pending_rows_by_file[filename].extend(pending_rows)
+    written = await write_pending_rows()
+
+    # the hashes are only saved once the rows are in the file, so a failed write gets the messages scanned again next time
+    if written and new_hashes:
+        scanned_hashes.update(new_hashes)
+        await asyncio.to_thread(save_scanned_hashes, filename, scanned_hashes)
 
     await ctx.send(f"Scanned {scanned} Apollo events, logged {logged} attendees.")
 
 
+# get the display names of everyone who reacted with a reaction, returns the emoji text with the names
+# members maps user ids to the guild's Member objects
+async def collect_reaction_names(reaction, members):
+    names = []
+
+    # stream the users from Discord and check for bot reactions cause we wanna skip those
+    async for user in reaction.users():
+        if user.bot:
+            continue
+
+        # Get display name from guild, we dont want username we want SERVER name so, look up the Member object and use .display_name
+        member = members.get(user.id)
+
+        # set display name to member object's display name, if there is a member otherwise use user.name (fallback)
+        names.append(member.display_name if member else user.name)
+
+    return str(reaction.emoji), names
+
+
 @bot.command(name="scan_all_reactions")
 async def scan_all_reactions(ctx):
     """
@@ -241,44 +443,41 @@ async def scan_all_reactions(ctx):
     Shows which user used what emoji as well.
     """
 
-    scanned = 0
+    # Use a dict to map emojis to the set of unique usernames {emoji: {usernames}}, and one for the number of reactions per emoji
+    emoji_summary = defaultdict(set)
+    emoji_counts = defaultdict(int)
 
-    # Use a dict to map emojis to usernames {emoji: [usernames]}
-    emoji_summary = defaultdict(list)
+    # fetch the history first, every message counts as scanned. Change `limit`` if you want
+    messages = [msg async for msg in ctx.channel.history(limit=50)]
+    scanned = len(messages)
 
-    # Change `limit`` if you want
-    async for msg in ctx.channel.history(limit=50):
-        scanned += 1
+    # member objects by user id, collect_reaction_names reads from here instead of the guild
+    members = {member.id: member for member in ctx.guild.members}
 
-        # iterate over every reaction in message and find users who reacted
-        for reaction in msg.reactions:
+    # every reaction needs its own request(s) to Discord for the users, one task per reaction of every message
+    fetches = [collect_reaction_names(reaction, members) for msg in messages for reaction in msg.reactions]
 
-            # use list comprehension to get the user and iterate for every user in "users" list, and check for bot reactions cause we wanna skip those
-            users = [user async for user in reaction.users()]
-            for user in users:
-                if user.bot:
-                    continue
-
-                # Get display name from guild, we dont want username we want SERVER name so, fetch the Member object from the guild and use .display_name
-                member = ctx.guild.get_member(user.id)
-
-                # set display name to member object's display name, if there is a member otherwise use user.name (fallback)
-                display_name = member.display_name if member else user.name
-                emoji_summary[str(reaction.emoji)].append(display_name)
+    # then fetch the users of all reactions at once, so the requests don't wait on each other, discord.py still keeps them within the rate limit
+    for emoji, names in await asyncio.gather(*fetches):
+        # reactions only made by bots are left out
+        if names:
+            emoji_summary[emoji].update(names)
+            emoji_counts[emoji] += len(names)
 
     # check for reactions
     if not emoji_summary:
         await ctx.send("No reactions found in the last 50 messages.")
         return
 
+    # one line per emoji, built straight from the summary
     lines = [f"**Reactions Summary (from last {scanned} messages)**\n"]
-    for emoji, users in emoji_summary.items():
-        unique_users = set(users)
-        lines.append(
-            f"{emoji} — {len(users)} reaction(s) from: {', '.join(unique_users)}"
-        )
+    lines.extend(
+        f"{emoji} — {emoji_counts[emoji]} reaction(s) from: {', '.join(users)}"
+        for emoji, users in emoji_summary.items()
+    )
 
-    await ctx.send("\n".join(lines))
+    for chunk in chunk_lines(lines):
+        await ctx.send(chunk)
 
 
 # The command to show the leaderboard
@@ -286,87 +485,67 @@ async def scan_all_reactions(ctx):
 async def leaderboard(ctx):
     filename = get_csv_filename()
 
+    # write the queued reaction rows first, so they are counted too
+    await write_pending_rows()
+
     if not os.path.isfile(filename):
         await ctx.send("No attendance data for this month yet.")
         return
 
-    attendance = defaultdict(set)  # user_id -> set of accepted event IDs
-    declined = defaultdict(set)  # user_id -> set of declined event IDs
-    usernames = {}  # user_id -> pretty username
-
-    with open(filename, newline="", encoding="utf-8") as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            raw_username = row["Username"].strip()
-            user_id = raw_username.lower()
-            event_id = row["EventID"].strip()
-            response = row.get("Response", "accepted").lower()
-
-            usernames[user_id] = raw_username
-            if response == "accepted":
-                attendance[user_id].add(event_id)
-            elif response == "declined":
-                declined[user_id].add(event_id)
+    # parse the file in a worker thread, so the bot isn't blocked while reading a whole month of attendance
+    attendance, declined, usernames = await asyncio.to_thread(load_attendance, filename)
 
     total_events = 8  # fix as per your monthly events
+    max_to_print = 40
 
-    # Sort accepted users by descending attendance count, then username
-    accepted_sorted = sorted(
-        attendance.items(), key=lambda x: (-len(x[1]), usernames.get(x[0], ""))
+    # top max_to_print attendees, most events first then by username
+    # plain (-count, username, user_id) tuples compare on their own, no key function needed, user_id breaks any tie
+    accepted_sorted = heapq.nsmallest(
+        max_to_print, ((-len(events), usernames.get(user_id, ""), user_id) for user_id, events in attendance.items())
     )
 
     lines = [f"**Attendance Leaderboard {datetime.now().strftime('%B')}**"]
-    max_to_print = 40
+    append = lines.append  # looked up once, the loops below call it for every printed user
     count_printed = 0
 
     # Print accepted attendees (up to max_to_print)
-    for i, (user_id, events) in enumerate(accepted_sorted, start=1):
-        count = len(events)
+    for i, (neg_count, username, user_id) in enumerate(accepted_sorted, start=1):
+        count = -neg_count
         if count == 0:
             continue
-        username = usernames.get(user_id, "Unknown")
-        lines.append(f"{i}. **{username}** - {count}/{total_events} events ✅")
+        append(f"{i}. **{username}** - {count}/{total_events} events ✅")
         count_printed += 1
         if count_printed >= max_to_print:
             break
 
     if count_printed == 0:
-        lines.append("No attendees logged this month.")
+        append("No attendees logged this month.")
     else:
-        lines.append(f"\nTotal unique attendees (accepted): {len(attendance)}")
+        append(f"\nTotal unique attendees (accepted): {len(attendance)}")
 
-    # Filter declined users to only those who never accepted anything
-    declined_only = {
-        uid: evts for uid, evts in declined.items() if uid not in attendance
-    }
+    # Filter declined users to only those who never accepted anything, the key views do the set difference for us
+    declined_only = declined.keys() - attendance.keys()
 
     if declined_only:
-        lines.append(f"\n**Declined (❌)**")
-        declined_sorted = sorted(
-            declined_only.items(), key=lambda x: (-len(x[1]), usernames.get(x[0], ""))
+        append(f"\n**Declined (❌)**")
+        # the declined users share max_to_print with the attendees printed above
+        declined_sorted = heapq.nsmallest(
+            max_to_print - count_printed,
+            ((-len(declined[user_id]), usernames.get(user_id, ""), user_id) for user_id in declined_only)
         )
-        for i, (user_id, events) in enumerate(declined_sorted, start=1):
-            if i + count_printed > max_to_print:
-                break
-            username = usernames.get(user_id, "Unknown")
-            lines.append(
-                f"{count_printed + i}. **{username}** - {len(events)} declines ❌"
+        for i, (neg_count, username, user_id) in enumerate(declined_sorted, start=1):
+            append(
+                f"{count_printed + i}. **{username}** - {-neg_count} declines ❌"
             )
 
     # Total unique responders (accepted + declined)
-    unique_responders = set(attendance.keys()) | set(declined.keys())
-    lines.append(f"\nTotal unique responders: {len(unique_responders)}")
+    unique_responders = attendance.keys() | declined.keys()
+    append(f"\nTotal unique responders: {len(unique_responders)}")
 
-    # Send message (consider splitting if too long)
-    message = "\n".join(lines)
-    if len(message) > 1900:
-
-        # Optional: split message if too long
-        chunks = [message[i : i + 1900] for i in range(0, len(message), 1900)]
-        for chunk in chunks:
-            await ctx.send(chunk)
-    else:
-        await ctx.send(message)
+    # Send message, split on line boundaries if it's too long
+    # the chunks are sent one after another on purpose, sent concurrently Discord may post them out of order and mix up the ranking
+    for chunk in chunk_lines(lines):
+        await ctx.send(chunk)
 
 
 # Run the bot with token of server